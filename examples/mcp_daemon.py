@@ -0,0 +1,242 @@
+"""Keep the podcast-transcriber MCP server running between CLI invocations
+
+`serve` runs the MCP server command once and exposes its stdio on a Unix
+domain socket, one client at a time. `bridge` relays its own stdin/stdout
+to that socket, so an MCP stdio client can launch it in place of the
+server itself. Only the standard library is used to keep `bridge` quick
+to start.
+
+Each connection opens with a one-line hello: `session` to take over the
+server's stdio, or `ping` to ask whether that would succeed. The daemon
+answers `ok` or `busy`; a busy daemon closes the connection instead of
+queueing the client behind the current session.
+
+Every client numbers its JSON-RPC requests from the start, and a request
+can still be running when its client goes away. The daemon therefore
+gives each request an id of its own and maps replies back, dropping those
+for a client that has left (whose requests it also cancels).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# MCP stdio messages are newline-delimited JSON and transcripts can be long
+_STREAM_LIMIT = 64 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+class DaemonBusyError(RuntimeError):
+    """Another client is already using the daemon's MCP server"""
+
+
+def _ping(socket_path):
+    """Return the daemon's answer to a ping, or None if nothing listens"""
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(b"ping\n")
+            with sock.makefile("rb") as reply:
+                return reply.readline().strip() or None
+        except OSError:
+            return None
+
+
+def ensure_daemon(socket_path, command, timeout=10):
+    """Start the daemon for `command` unless one already listens on socket_path
+
+    Raises DaemonBusyError if a running daemon is serving another client.
+    This blocks, so call it from an executor when an event loop is running.
+    """
+    socket_path = Path(socket_path)
+    status = _ping(socket_path)
+    if status == b"busy":
+        raise DaemonBusyError(
+            f"The MCP daemon on {socket_path} is busy with another session; "
+            "only one assistant can use it at a time")
+    if status:
+        return
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(socket_path.with_suffix(".log"), "ab") as log_file:
+        subprocess.Popen(
+            [sys.executable, __file__, "serve",
+             str(socket_path), *command],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + timeout
+    while not _ping(socket_path):
+        if time.monotonic() > deadline:
+            raise RuntimeError(
+                f"MCP daemon did not start; see {socket_path.with_suffix('.log')}")
+        time.sleep(0.05)
+
+
+def _decode(line):
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _encode(message):
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def _cancellation(request_id):
+    return _encode({
+        "jsonrpc": "2.0",
+        "method": "notifications/cancelled",
+        "params": {"requestId": request_id, "reason": "Client disconnected"},
+    })
+
+
+async def serve(socket_path, command):
+    """Run the MCP server command and hand its stdio to one client at a time"""
+    socket_path = Path(socket_path)
+    process = await asyncio.create_subprocess_exec(*command,
+                                                   stdin=subprocess.PIPE,
+                                                   stdout=subprocess.PIPE,
+                                                   limit=_STREAM_LIMIT)
+    request_ids = itertools.count(1)
+    client = None  # (writer, {daemon request id: client request id})
+
+    async def route_output():
+        """Deliver the server's messages to the current client, if any"""
+        while line := await process.stdout.readline():
+            if client is None:
+                continue
+            writer, pending = client
+            message = _decode(line)
+            if (isinstance(message, dict) and "method" not in message
+                    and "id" in message):
+                if message["id"] not in pending:
+                    continue  # a reply meant for an earlier client
+                message["id"] = pending.pop(message["id"])
+                line = _encode(message)
+            writer.write(line)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def forward_requests(reader, pending):
+        while line := await reader.readline():
+            message = _decode(line)
+            if isinstance(message, dict) and "method" in message:
+                if "id" in message:
+                    daemon_id = next(request_ids)
+                    pending[daemon_id] = message["id"]
+                    message["id"] = daemon_id
+                    line = _encode(message)
+                elif message["method"] == "notifications/cancelled":
+                    params = message.get("params") or {}
+                    for daemon_id, client_id in pending.items():
+                        if client_id == params.get("requestId"):
+                            del pending[daemon_id]
+                            params["requestId"] = daemon_id
+                            line = _encode(message)
+                            break
+            process.stdin.write(line)
+            await process.stdin.drain()
+
+    async def handle_client(reader, writer):
+        nonlocal client
+        hello = await reader.readline()
+        if client is not None or hello != b"session\n":
+            writer.write(b"busy\n" if client is not None else b"ok\n")
+            writer.close()
+            return
+        pending = {}
+        client = (writer, pending)
+        writer.write(b"ok\n")
+        try:
+            # The session ends when the client hangs up
+            await forward_requests(reader, pending)
+        except ConnectionError:
+            pass
+        finally:
+            client = None
+            # Let the server stop working on requests nobody waits for
+            for daemon_id in pending:
+                process.stdin.write(_cancellation(daemon_id))
+            writer.close()
+
+    router = asyncio.create_task(route_output())
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, process.terminate)
+    loop.add_signal_handler(signal.SIGINT, process.terminate)
+
+    # Replace the socket of a daemon that died without cleaning up
+    socket_path.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle_client,
+                                             path=str(socket_path),
+                                             limit=_STREAM_LIMIT)
+    try:
+        await process.wait()
+    finally:
+        router.cancel()
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def bridge(socket_path):
+    """Relay this process's stdin and stdout to the daemon's socket"""
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(b"session\n")
+        status = b""
+        while not status.endswith(b"\n"):
+            byte = sock.recv(1)
+            if not byte:
+                break
+            status += byte
+        if not status:
+            sys.exit(f"The MCP daemon on {socket_path} closed the connection")
+        if status != b"ok\n":
+            sys.exit(f"The MCP daemon on {socket_path} is busy with another "
+                     "session; only one assistant can use it at a time")
+
+        def upstream():
+            for chunk in iter(lambda: os.read(0, _CHUNK_SIZE), b""):
+                sock.sendall(chunk)
+            sock.shutdown(socket.SHUT_WR)
+
+        threading.Thread(target=upstream, daemon=True).start()
+
+        stdout = sys.stdout.buffer
+        for chunk in iter(lambda: sock.recv(_CHUNK_SIZE), b""):
+            stdout.write(chunk)
+            stdout.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Share one MCP stdio server across processes")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run the MCP server behind a Unix socket")
+    serve_parser.add_argument("socket", type=Path)
+    serve_parser.add_argument("command", nargs=argparse.REMAINDER)
+    bridge_parser = subparsers.add_parser(
+        "bridge", help="Connect stdin/stdout to a running daemon")
+    bridge_parser.add_argument("socket", type=Path)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(serve(args.socket, args.command))
+    else:
+        bridge(args.socket)
@@ -1,18 +1,74 @@
 import argparse
 import asyncio
+import functools
+import hashlib
+import html
+import json
+import logging
 import os
+import re
 import shutil
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
+from string import Template
+from urllib.parse import urlparse
 
+import aiohttp
+import feedparser
 from agents import Agent, Runner, trace
 from agents.mcp import MCPServerStdio
-
-
-class PodcastAssistant:
-
-    def __init__(self, mcp_server):
-        self.mcp_server = mcp_server
-        self.base_instructions = """
+from rapidfuzz import fuzz, process, utils
+
+import mcp_daemon
+
+log = logging.getLogger(__name__)
+
+# The MCP server lives next to this example; resolved once at import
+_MCP_JS = (Path(__file__).parent.parent / "src" / "index.js").resolve()
+_NODE = shutil.which("node")
+
+CACHE_DIR = Path.home() / ".cache" / "podcast-transcriber"
+MCP_SOCKET = CACHE_DIR / "mcp.sock"
+FEED_CACHE_TTL = 15 * 60  # seconds
+# Bumped whenever the stored episode format changes; older caches are dropped
+FEED_CACHE_VERSION = 3
+DESCRIPTION_MAX_CHARS = 500
+# Only the newest episodes are listed and put in the agent instructions;
+# topic search and summarize cover the whole feed
+RECENT_EPISODE_COUNT = 10
+MAX_CONCURRENT_FEED_FETCHES = 3
+FEED_FETCH_TIMEOUT = 20  # seconds
+MAX_CONCURRENT_DOWNLOADS = 2
+PREFETCH_EPISODE_COUNT = 3
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+# Episodes can take long to download, so only a stalled download times out
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30,
+                                         sock_read=60)
+TOPIC_MATCH_LIMIT = 5
+TOPIC_MATCH_CUTOFF = 50  # rapidfuzz score, 0-100
+# Chunks are transcribed one after another, so use the largest size the
+# Whisper API accepts (uploads over 25MB are rejected)
+MAX_CHUNK_SIZE_MB = 20
+
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+# Words that say nothing about a topic ("which episodes talk about the 80s")
+_STOPWORDS = frozenset("""
+    a about all an and any are as at be by can did do does episode episodes
+    for from had has have how i in is it its me my of on or our podcast
+    podcasts show shows so talk talked talking talks that the their them
+    there these they this to us was we were what when where which who why
+    with you your
+    """.split())
+
+# "which episode(s) (is/are) (about) ...", also catching the "eposide" typo
+_WHICH_EPISODE_RE = re.compile(
+    r"which\s+ep[io]s[io]des?(?:\s+(?:is|are))?(?:\s+about)?\b\s*(.*)",
+    re.I | re.S)
+
+BASE_INSTRUCTIONS = """
             You are a helpful podcast assistant that can:
             1. Fetch and browse podcast RSS feeds
             2. Search for episodes by topic
@@ -25,7 +81,9 @@ class PodcastAssistant:
             1. First find the episode in the feed to get its audio URL
             2. Transcribe the episode directly using the transcribe_audio tool
                - Use the episode's audio URL in the episode_url parameter
-               - Set full_transcription=true and max_chunk_size=20
+               - To transcribe several episodes, pass all their audio URLs
+                 in the episode_urls parameter of a single call
+               - Set full_transcription=true and max_chunk_size=20 unless told otherwise
             3. Provide a detailed summary of the key points, insights, and takeaways
             
             Important: The transcribe_audio tool now handles downloading automatically, 
@@ -34,196 +92,632 @@ class PodcastAssistant:
             
             Always be conversational and helpful. Maintain context of the conversation.
             """
-        self.agent = self._create_agent()
+FEED_SUFFIX_TMPL = Template("""
+            
+            Current podcast RSS feed: $feed_url
+            Remember to use this feed URL for all operations unless explicitly told to use a different one.
+            """)
+TITLE_SUFFIX_TMPL = Template("This is the '$podcast_title' podcast.")
+EPISODES_SUFFIX_TMPL = Template("""
+            The feed has already been parsed. Its most recent episodes are
+            (JSON, "num" is the episode number the user refers to):
+            $episodes_json
+            Use this list instead of fetching the feed again. Older episodes
+            continue the numbering; the user can search them with "find".
+            """)
+
+
+class FeedCache:
+    """Parsed feed metadata keyed by feed URL, kept in memory and on disk"""
+
+    def __init__(self, path=CACHE_DIR / "feeds.json", ttl=FEED_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == FEED_CACHE_VERSION:
+                self._entries = data["feeds"]
+            else:
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": FEED_CACHE_VERSION, "feeds": self._entries},
+                      f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, feed_url):
+        """Return the cached entry for a feed, or None"""
+        return self._load().get(feed_url)
+
+    def is_fresh(self, entry):
+        """Whether an entry was fetched within the TTL"""
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, feed_url, podcast_title, episodes, etag=None,
+            last_modified=None):
+        """Store a freshly parsed feed"""
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "podcast_title": podcast_title,
+            "episodes": episodes,
+        }
+        self._load()[feed_url] = entry
+        self._save()
+        return entry
+
+    def touch(self, feed_url):
+        """Mark an entry as revalidated (e.g. after a 304 Not Modified)"""
+        entry = self._load()[feed_url]
+        entry["fetched_at"] = time.time()
+        self._save()
+        return entry
+
+
+def _clean_description(description):
+    """Plain-text show notes, shortened to DESCRIPTION_MAX_CHARS"""
+    text = html.unescape(_HTML_TAG_RE.sub(" ", description or ""))
+    text = " ".join(text.split())
+    if len(text) > DESCRIPTION_MAX_CHARS:
+        text = text[:DESCRIPTION_MAX_CHARS].rsplit(" ", 1)[0] + "..."
+    return text
+
+
+def _parse_episodes(parsed):
+    """Build the numbered episode list from a feedparser result
+
+    Episodes are numbered newest first. Serial podcasts list their items
+    oldest first, so entries are sorted by date; undated ones keep their
+    feed order after the dated ones.
+    """
+    def published(entry):
+        published_parsed = entry.get("published_parsed")
+        return (published_parsed is not None, published_parsed or ())
+
+    entries = sorted(parsed.entries, key=published, reverse=True)
+    episodes = []
+    for num, entry in enumerate(entries, 1):
+        enclosures = entry.get("enclosures") or [{}]
+        episodes.append({
+            "num": num,
+            "title": entry.get("title"),
+            "audio_url": enclosures[0].get("href"),
+            "duration": entry.get("itunes_duration"),
+            "description": _clean_description(entry.get("description")),
+        })
+    return episodes
+
+
+def _episode_fields(episodes, *keys):
+    """Copies of the episodes with only the given keys"""
+    return [{key: episode[key] for key in keys} for episode in episodes]
+
+
+def _topic_words(text):
+    """Normalized text without stopwords, for fuzzy matching"""
+    return " ".join(word for word in utils.default_process(text).split()
+                    if word not in _STOPWORDS)
+
+
+def rank_episodes(topic, episodes, limit=TOPIC_MATCH_LIMIT):
+    """Return the episodes whose title and description best match a topic
+
+    This only finds words the topic shares with the show notes; related
+    episodes that use other words are left for the agent to spot.
+    """
+    query = _topic_words(topic)
+    if not query:
+        return []
+    choices = {
+        index: _topic_words(
+            f"{episode['title'] or ''} {episode['description'] or ''}")
+        for index, episode in enumerate(episodes)
+    }
+    matches = process.extract(query,
+                              choices,
+                              scorer=fuzz.token_set_ratio,
+                              processor=None,
+                              limit=limit,
+                              score_cutoff=TOPIC_MATCH_CUTOFF)
+    return [episodes[index] for _, _, index in matches]
+
+
+@functools.lru_cache(maxsize=8)
+def _render_instructions(feed_url=None, podcast_title=None, episodes_json=None):
+    """Agent instructions for a feed; cached since feeds are revisited"""
+    instructions = BASE_INSTRUCTIONS
+    if feed_url:
+        instructions += FEED_SUFFIX_TMPL.substitute(feed_url=feed_url)
+        if podcast_title:
+            instructions += TITLE_SUFFIX_TMPL.substitute(
+                podcast_title=podcast_title)
+        if episodes_json:
+            instructions += EPISODES_SUFFIX_TMPL.substitute(
+                episodes_json=episodes_json)
+    return instructions
+
+
+class PodcastAssistant:
+
+    def __init__(self, mcp_server, session, feed_cache=None):
+        self.mcp_server = mcp_server
+        self.session = session
+        self.feed_cache = feed_cache or FeedCache()
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEED_FETCHES)
+        self._download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        self._prefetch_tasks = {}  # audio URL -> download task
+        # audio URL -> size in bytes (None if unknown), for this session only
+        self.audio_sizes = {}
         self.feed_url = None
         self.episodes = None
         self.temp_dir = None
         self.podcast_title = None
+        self.agent = self._create_agent()
+        # verb -> (handler, whether the verb takes an argument)
+        self._commands = {
+            "feed": (self._feed_command, True),
+            "find": (self._find_command, True),
+            "summarize": (self._summarize_command, True),
+            "help": (self._help_command, False),
+            "exit": (self._exit_command, False),
+        }
+
+    def _build_instructions(self, with_feed=None):
+        """Agent instructions for the current feed"""
+        episodes_json = None
+        if with_feed and self.episodes:
+            # Descriptions stay out: these instructions go with every request
+            episodes_json = json.dumps(
+                _episode_fields(self.episodes[:RECENT_EPISODE_COUNT], "num",
+                                "title", "duration"),
+                separators=(",", ":"))
+        return _render_instructions(with_feed, self.podcast_title,
+                                    episodes_json)
 
     def _create_agent(self, with_feed=None):
-        """Create a new agent with updated instructions"""
-        instructions = self.base_instructions
-
-        if with_feed:
-            instructions += f"""
-            
-            Current podcast RSS feed: {with_feed}
-            Remember to use this feed URL for all operations unless explicitly told to use a different one.
-            """
-            if self.podcast_title:
-                instructions += f"This is the '{self.podcast_title}' podcast."
-
+        """Create the agent; later feed changes only update its instructions"""
         return Agent(
             name="Podcast Discovery Assistant",
-            instructions=instructions,
+            instructions=self._build_instructions(with_feed),
             mcp_servers=[self.mcp_server],
         )
 
-    async def start(self, feed_url=None):
-        if feed_url:
-            self.feed_url = feed_url
-            await self._fetch_feed(feed_url)
-
-    async def _fetch_feed(self, feed_url):
-        """Fetch the podcast RSS feed and save the data"""
-        print(f"Fetching RSS feed: {feed_url}")
-        result = await Runner.run(
-            starting_agent=self.agent,
-            input=
-            f"Fetch the podcast RSS feed at {feed_url} and list the 10 most recent episodes. Format the list with numbers, titles and durations."
-        )
+    async def start(self, feed_urls=None):
+        if feed_urls:
+            if isinstance(feed_urls, str):
+                feed_urls = [feed_urls]
+            await self._fetch_feed(*feed_urls)
 
-        # Store the feed URL
+    def _use_feed(self, feed_url, entry):
+        """Make a cached feed entry the current feed"""
         self.feed_url = feed_url
+        self.podcast_title = entry["podcast_title"]
+        self.episodes = entry["episodes"]
+        self.agent.instructions = self._build_instructions(with_feed=feed_url)
+
+        log.info("Podcast title: %s", self.podcast_title)
+        for episode in self.episodes[:RECENT_EPISODE_COUNT]:
+            duration = episode["duration"] or "unknown"
+            log.info("%s. %s (%s)", episode["num"], episode["title"], duration)
+
+        self._prefetch_audio()
+
+    def _prefetch_audio(self):
+        """Start downloading the newest episodes' audio in the background"""
+        for episode in self.episodes[:PREFETCH_EPISODE_COUNT]:
+            audio_url = episode["audio_url"]
+            if audio_url and audio_url not in self._prefetch_tasks:
+                self._prefetch_tasks[audio_url] = asyncio.create_task(
+                    self._download_one(audio_url))
+
+    def _audio_path(self, audio_url):
+        """Return where an episode's audio is downloaded to in temp_dir"""
+        if not self.temp_dir:
+            self.temp_dir = tempfile.mkdtemp(prefix="podcast-assistant-")
+        # The transcription API infers the audio format from the extension
+        suffix = Path(urlparse(audio_url).path).suffix or ".mp3"
+        return Path(self.temp_dir) / (
+            hashlib.sha256(audio_url.encode()).hexdigest() + suffix)
+
+    async def _download_one(self, audio_url):
+        """Download an episode's audio into temp_dir, returning its path
+
+        Returns None if the download fails; transcribe_audio then fetches it
+        itself. The failed task is forgotten so the next feed reload or
+        summarize retries, resuming the partial file with a Range request.
+        """
+        path = self._audio_path(audio_url)
+        partial_path = path.with_name(path.name + ".part")
 
-        # Try to extract podcast title from response
         try:
-            response_text = result.final_output
-            if "Title:" in response_text:
-                title_line = [
-                    line for line in response_text.split('\n')
-                    if "Title:" in line
-                ]
-                if title_line:
-                    self.podcast_title = title_line[0].split(
-                        "Title:")[1].strip()
-                    print(f"Podcast title: {self.podcast_title}")
-        except Exception:
-            # Just ignore if we can't extract the title
-            pass
-
-        # Update the agent with the new feed URL
-        self.agent = self._create_agent(with_feed=feed_url)
-
-        print(result.final_output)
+            async with self._download_semaphore:
+                await self._download_to(audio_url, partial_path)
+            partial_path.rename(path)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            log.debug("Prefetching %s failed: %s", audio_url, e)
+            if self._prefetch_tasks.get(audio_url) is asyncio.current_task():
+                del self._prefetch_tasks[audio_url]
+            return None
+        return path
+
+    async def _download_to(self, audio_url, partial_path):
+        """Download audio into partial_path, resuming what is already there"""
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        async with self.session.get(audio_url,
+                                    headers=headers,
+                                    timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status == 416 and offset:
+                # Nothing past the offset: the file is either complete or
+                # has changed since, in which case it's fetched again
+                if response.headers.get("Content-Range") != f"bytes */{offset}":
+                    partial_path.unlink()
+                    await self._download_to(audio_url, partial_path)
+                return
+            response.raise_for_status()
+            mode = "ab" if response.status == 206 else "wb"
+            with open(partial_path, mode) as f:
+                async for chunk in response.content.iter_chunked(
+                        DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+    def _stale_entry(self, feed_url, cached):
+        """Fall back to an expired cache entry when a feed can't be fetched"""
+        if cached:
+            log.warning("Using the copy of %s cached %s", feed_url,
+                        time.strftime("%Y-%m-%d %H:%M",
+                                      time.localtime(cached["fetched_at"])))
+        return cached
+
+    async def _load_feed(self, feed_url):
+        """Return the cache entry for a feed, fetching it if it is stale"""
+        cached = self.feed_cache.get(feed_url)
+        if cached and self.feed_cache.is_fresh(cached):
+            return cached
+
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with self._fetch_semaphore:
+            log.info("Fetching RSS feed: %s", feed_url)
+            try:
+                async with self.session.get(
+                        feed_url,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(
+                            total=FEED_FETCH_TIMEOUT)) as response:
+                    if cached and response.status == 304:
+                        return self.feed_cache.touch(feed_url)
+                    response.raise_for_status()
+                    content = await response.read()
+            except asyncio.TimeoutError:
+                log.warning("Timed out fetching the RSS feed at %s", feed_url)
+                return self._stale_entry(feed_url, cached)
+            except aiohttp.ClientError as e:
+                log.warning("Could not fetch the RSS feed at %s: %s",
+                            feed_url, e)
+                return self._stale_entry(feed_url, cached)
+
+        parsed = await asyncio.get_running_loop().run_in_executor(
+            None, feedparser.parse, content)
+
+        episodes = _parse_episodes(parsed)
+        podcast_title = parsed.feed.get("title")
+        if not (podcast_title and episodes):
+            log.warning("Could not parse the RSS feed at %s: %s", feed_url,
+                        parsed.get("bozo_exception", "no episodes found"))
+            return None
+
+        return self.feed_cache.put(
+            feed_url,
+            podcast_title,
+            episodes,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"))
+
+    async def _fetch_feed(self, *feed_urls):
+        """Fetch one or more podcast RSS feeds concurrently
+
+        Every feed is stored in the feed cache; the last one that loads
+        becomes the current feed.
+        """
+        entries = await asyncio.gather(
+            *(self._load_feed(feed_url) for feed_url in feed_urls))
+        loaded = [(feed_url, entry)
+                  for feed_url, entry in zip(feed_urls, entries) if entry]
+        if not loaded:
+            return
+
+        for feed_url, entry in loaded[:-1]:
+            log.info("Cached %d episodes of '%s' (%s)",
+                     len(entry["episodes"]), entry["podcast_title"], feed_url)
+        self._use_feed(*loaded[-1])
+
+    async def _run_streamed(self, prompt):
+        """Run the agent and print its answer as it is generated"""
+        result = Runner.run_streamed(starting_agent=self.agent, input=prompt)
+        async for event in result.stream_events():
+            if (event.type == "raw_response_event"
+                    and event.data.type == "response.output_text.delta"):
+                delta = event.data.delta
+                sys.stdout.write(delta)
+                # stdout is line buffered; also flush at sentence ends
+                if delta.rstrip().endswith((".", "!", "?", ":")):
+                    sys.stdout.flush()
+        sys.stdout.write("\n")
+        return result
+
+    async def prefetch_episode_audio_headers(self):
+        """Send HEAD requests for the current episodes' audio files
+
+        Meant to run while the user is typing: it warms up the connections
+        to the audio hosts and records each file's size.
+        """
+
+        async def fetch_size(audio_url):
+            # Not limited by _fetch_semaphore, so a feed command typed
+            # meanwhile isn't queued behind slow audio hosts
+            try:
+                async with self.session.head(
+                        audio_url,
+                        allow_redirects=True,
+                        timeout=aiohttp.ClientTimeout(total=10),
+                ) as response:
+                    self.audio_sizes[audio_url] = (
+                        response.content_length if response.ok else None)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.audio_sizes[audio_url] = None
+
+        await asyncio.gather(
+            *(fetch_size(episode["audio_url"])
+              for episode in (self.episodes or [])[:RECENT_EPISODE_COUNT]
+              if episode["audio_url"]
+              and episode["audio_url"] not in self.audio_sizes))
 
     async def find_episodes_by_topic(self, topic):
         """Find episodes related to a specific topic"""
         if not self.feed_url:
-            print(
-                "No podcast feed loaded. Please provide an RSS feed URL first."
-            )
+            log.warning("No podcast feed loaded. "
+                        "Please provide an RSS feed URL first.")
             return
 
-        print(f"Searching for episodes about: {topic}")
-        result = await Runner.run(
-            starting_agent=self.agent,
-            input=
-            f"Using the podcast feed {self.feed_url}, find episodes that discuss {topic}. Provide a numbered list of relevant episodes with their titles and a brief description."
+        log.info("Searching for episodes about: %s", topic)
+        # The best local matches plus the recent episodes, so the agent can
+        # also find episodes on the topic that use different words
+        matches = rank_episodes(topic, self.episodes)
+        candidates = _episode_fields(
+            matches + [episode
+                       for episode in self.episodes[:RECENT_EPISODE_COUNT]
+                       if episode not in matches],
+            "num", "title", "description")
+
+        await self._run_streamed(
+            f"Given these candidate episodes, pick and describe the ones actually discussing {topic}. Provide a numbered list using their episode numbers, with titles and a brief description. If none of them do, say so.\n{json.dumps(candidates)}"
         )
-        print(result.final_output)
 
-    async def summarize_episode(self, episode_number):
-        """Transcribe and summarize the specified episode"""
+    async def summarize_episode(self, episode_numbers):
+        """Transcribe and summarize the specified episodes in one batch"""
         if not self.feed_url:
-            print(
-                "No podcast feed loaded. Please provide an RSS feed URL first."
-            )
+            log.warning("No podcast feed loaded. "
+                        "Please provide an RSS feed URL first.")
             return
 
-        print(f"Summarizing episode {episode_number}...")
-        result = await Runner.run(starting_agent=self.agent,
-                                  input=f"""
-            For episode {episode_number} from the podcast feed {self.feed_url}:
-            1. First, find the episode in the feed to get its audio URL
-            2. Transcribe the episode using the transcribe_audio tool
-               - Pass the episode's audio URL directly to the tool (episode_url parameter)
-               - Use full_transcription=true and max_chunk_size=20
-            3. Provide a comprehensive summary of the episode content
-            """)
-        print("\nEpisode Summary:\n")
-        print(result.final_output)
+        episode_numbers = list(dict.fromkeys(episode_numbers))
+        episodes_by_num = {e["num"]: e for e in self.episodes or []}
+        missing = [n for n in episode_numbers if n not in episodes_by_num]
+        if missing:
+            log.warning("Not in the current feed: episode %s",
+                        ", ".join(map(str, missing)))
+            return
+        episodes = [episodes_by_num[n] for n in episode_numbers]
+        no_audio = [e["num"] for e in episodes if not e["audio_url"]]
+        if no_audio:
+            log.warning("No audio file in the feed for episode %s",
+                        ", ".join(map(str, no_audio)))
+            return
+
+        total_size = sum(
+            self.audio_sizes.get(e["audio_url"]) or 0 for e in episodes)
+        size_note = f" ({total_size / 2**20:.0f}MB of audio)" if total_size else ""
+        log.info("Summarizing episode %s%s...",
+                 ", ".join(map(str, episode_numbers)), size_note)
+        episode_list = "\n".join(
+            f"               - Episode {e['num']} (\"{e['title']}\"): {e['audio_url']}"
+            for e in episodes)
+        episode_urls = json.dumps([e["audio_url"] for e in episodes])
+
+        # Hand over audio that was already prefetched (waiting for downloads
+        # in progress, which would otherwise start again from scratch)
+        local_paths = []
+        for episode in episodes:
+            audio_url = episode["audio_url"]
+            task = self._prefetch_tasks.get(audio_url)
+            if not task:
+                # Resume a prefetch that failed part way through
+                path = self._audio_path(audio_url)
+                if path.with_name(path.name + ".part").exists():
+                    task = self._prefetch_tasks[audio_url] = (
+                        asyncio.create_task(self._download_one(audio_url)))
+            if task and not task.done():
+                log.info("Waiting for the download of episode %s to finish...",
+                         episode["num"])
+            local_path = await task if task else None
+            if task and not local_path:
+                log.info("Prefetching episode %s failed; the MCP server "
+                         "downloads it instead", episode["num"])
+            local_paths.append(str(local_path) if local_path else "")
+        local_paths_arg = ""
+        if any(local_paths):
+            local_paths_arg = f"""
+               - Pass local_paths={json.dumps(local_paths)}"""
+
+        prompt = f"""
+            For these episodes:
+{episode_list}
+            1. Transcribe them all with a single transcribe_audio call
+               - Pass episode_urls={episode_urls}{local_paths_arg}
+               - Use full_transcription=true and max_chunk_size={MAX_CHUNK_SIZE_MB}
+            2. Provide a comprehensive summary of each episode's content
+            """
+        log.info("\nEpisode Summary:\n")
+        await self._run_streamed(prompt)
+
+    async def _feed_command(self, arg):
+        # Several URLs are fetched together
+        await self._fetch_feed(*arg.split())
+
+    async def _find_command(self, arg):
+        await self.find_episodes_by_topic(arg)
+
+    async def _summarize_command(self, arg):
+        try:
+            episode_numbers = [int(n) for n in arg.split()]
+        except ValueError:
+            log.warning(
+                "Please specify a valid episode number to summarize.")
+            return
+        await self.summarize_episode(episode_numbers)
+
+    async def _help_command(self, arg):
+        log.info("\nCommands:")
+        log.info("  feed [URL ...]     - Set the podcast RSS feed URL")
+        log.info("  find [topic]       - Find episodes about a specific topic")
+        log.info("  summarize [N ...]  - Summarize episode number N (or several)")
+        log.info("  exit               - Exit the assistant")
+        log.info("  help               - Show this help message")
+
+        if self.feed_url:
+            log.info("\nCurrent podcast feed: %s", self.feed_url)
+            if self.podcast_title:
+                log.info("Podcast title: %s", self.podcast_title)
+
+    async def _exit_command(self, arg):
+        return False
 
     async def process_command(self, command):
-        """Process a user command"""
-        if command.lower().startswith("feed "):
-            # Handle setting the RSS feed
-            feed_url = command[5:].strip()
-            await self._fetch_feed(feed_url)
-
-        elif command.lower().startswith("find "):
-            # Handle finding episodes by topic
-            topic = command[5:].strip()
-            await self.find_episodes_by_topic(topic)
-
-        elif command.lower().startswith("summarize "):
-            # Handle summarizing an episode
-            try:
-                episode_number = int(command[10:].strip())
-                await self.summarize_episode(episode_number)
-            except ValueError:
-                print("Please specify a valid episode number to summarize.")
-
-        elif command.lower() == "help":
-            # Display help information
-            print("\nCommands:")
-            print("  feed [URL]      - Set the podcast RSS feed URL")
-            print("  find [topic]    - Find episodes about a specific topic")
-            print("  summarize [N]   - Summarize episode number N")
-            print("  exit            - Exit the assistant")
-            print("  help            - Show this help message")
-
-            if self.feed_url:
-                print(f"\nCurrent podcast feed: {self.feed_url}")
-                if self.podcast_title:
-                    print(f"Podcast title: {self.podcast_title}")
-
-        elif command.lower() == "exit":
-            # Exit the assistant
-            return False
-
-        elif command.lower().startswith("which episode") or command.lower(
-        ).startswith("which eposide"):
-            # Special handling for "which episode" questions
-            topic = command.lower().replace("which episode",
-                                            "").replace("which eposide",
-                                                        "").strip()
-            if topic.startswith("is about "):
-                topic = topic[9:].strip()
-            if topic.startswith("about "):
-                topic = topic[6:].strip()
+        """Process a user command, returning False once the user exits"""
+        command = command.strip()
+        verb, _, arg = command.partition(" ")
+        arg = arg.strip()
 
+        handler, takes_arg = self._commands.get(verb.lower(), (None, None))
+        if handler and takes_arg == bool(arg):
+            return await handler(arg) is not False
+
+        match = _WHICH_EPISODE_RE.match(command)
+        if match:
+            # Special handling for "which episode" questions
+            topic = match.group(1).strip()
             if topic:
                 await self.find_episodes_by_topic(topic)
             else:
-                print("Please specify a topic to search for.")
+                log.warning("Please specify a topic to search for.")
+            return True
 
-        else:
-            # Handle as a general query
-            context = ""
-            if self.feed_url:
-                context = f"Using the podcast feed {self.feed_url}: "
-
-            result = await Runner.run(starting_agent=self.agent,
-                                      input=f"{context}{command}")
-            print(result.final_output)
+        # Handle as a general query
+        context = ""
+        if self.feed_url:
+            context = f"Using the podcast feed {self.feed_url}: "
 
+        await self._run_streamed(f"{context}{command}")
         return True
 
-    def cleanup(self):
-        """Clean up resources when done"""
+    async def aclose(self):
+        """Clean up resources when done, without blocking the event loop"""
+        tasks = list(self._prefetch_tasks.values())
+        self._prefetch_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
         if self.temp_dir:
-            self._cleanup_temp_dir()
+            temp_dir, self.temp_dir = self.temp_dir, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, shutil.rmtree, temp_dir, True)
 
+    async def __aenter__(self):
+        return self
 
-async def interactive_mode(mcp_server, initial_feed=None):
-    """Run the podcast assistant in interactive mode"""
-    assistant = PodcastAssistant(mcp_server)
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+async def _ainput(prompt):
+    """Read a line from stdin without blocking the event loop
+
+    The line is read on a daemon thread from the unbuffered stdin file: a
+    thread of the loop's default executor would be joined at exit, so
+    Ctrl-C would wait for Enter, and a buffered read holds a lock that
+    breaks interpreter shutdown. Unlike aioconsole, this leaves the
+    terminal's file descriptors blocking, so output piped to another
+    process isn't dropped.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(set_outcome, value):
+        if not future.done():
+            set_outcome(value)
+
+    def read():
+        try:
+            line = sys.stdin.buffer.raw.readline()
+            if not line:
+                raise EOFError
+            outcome = (future.set_result,
+                       line.decode(sys.stdin.encoding).rstrip("\r\n"))
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # the loop has already been closed
 
-    print("\n===== Podcast Assistant =====")
-    print("Type 'help' for available commands or 'exit' to quit")
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
-    if initial_feed:
-        await assistant.start(initial_feed)
 
-    try:
-        keep_running = True
-        while keep_running:
-            command = input("\nWhat would you like to do? > ")
-            with trace(workflow_name="Podcast Assistant"):
-                keep_running = await assistant.process_command(command)
-    finally:
-        assistant.cleanup()
+async def interactive_mode(mcp_server, initial_feeds=None):
+    """Run the podcast assistant in interactive mode"""
+    async with aiohttp.ClientSession() as session:
+        async with PodcastAssistant(mcp_server, session) as assistant:
+            log.info("\n===== Podcast Assistant =====")
+            log.info("Type 'help' for available commands or 'exit' to quit")
+
+            if initial_feeds:
+                await assistant.start(initial_feeds)
+
+            prefetch = None
+            try:
+                keep_running = True
+                while keep_running:
+                    if prefetch is None or prefetch.done():
+                        prefetch = asyncio.create_task(
+                            assistant.prefetch_episode_audio_headers())
+                    command = await _ainput("\nWhat would you like to do? > ")
+                    with trace(workflow_name="Podcast Assistant"):
+                        keep_running = await assistant.process_command(
+                            command)
+            finally:
+                if prefetch is not None:
+                    prefetch.cancel()
 
 
 async def main():
@@ -232,20 +726,34 @@ async def main():
         description="Interactive Podcast Assistant")
     parser.add_argument("--rss-feed",
                         type=str,
-                        help="Provide a RSS feed URL. Search for your favorite podcasts on https://castos.com/tools/find-podcast-rss-feed",
+                        nargs="+",
+                        help="Provide one or more RSS feed URLs; the last one is opened. Search for your favorite podcasts on https://castos.com/tools/find-podcast-rss-feed",
                         required=True,
                         default="https://anchor.fm/s/ef6e2aa4/podcast/rss")
+    parser.add_argument("--daemon",
+                        action="store_true",
+                        help=f"Keep the MCP server running in the background (on {MCP_SOCKET}) and reuse it on later runs")
     args = parser.parse_args()
-
-    # Ensure the podcast-transcriber-mcp exists
-    mcp_path = Path(".")
+    if args.daemon and sys.platform == "win32":
+        parser.error("--daemon needs Unix domain sockets, which are not "
+                     "supported on Windows")
+
+    command, command_args = _NODE, [str(_MCP_JS)]
+    if args.daemon:
+        # Attach to the shared server through a small stdio <-> socket bridge
+        # (starting the daemon blocks while it waits for the socket)
+        await asyncio.get_running_loop().run_in_executor(
+            None, mcp_daemon.ensure_daemon, MCP_SOCKET,
+            [command, *command_args])
+        command = sys.executable
+        command_args = [mcp_daemon.__file__, "bridge", str(MCP_SOCKET)]
 
     # Connect to the podcast-transcriber-mcp server
     async with MCPServerStdio(
         cache_tools_list=True,
         params={
-            "command": "node",
-            "args": [str(mcp_path.joinpath("src/index.js").resolve())],
+            "command": command,
+            "args": command_args,
             "env": {
                 "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", ""),
             }
@@ -256,15 +764,35 @@ async def main():
 
 if __name__ == "__main__":
     # Check for required dependencies
-    if not shutil.which("node"):
+    if not _NODE:
         raise RuntimeError(
             "Node.js is not installed. Please install Node.js to run this script."
         )
 
+    # Ensure the podcast-transcriber-mcp exists
+    if not _MCP_JS.is_file():
+        raise RuntimeError(f"MCP server not found at {_MCP_JS}. "
+                           "Run this script from a full repository checkout.")
+
     # Check for OPENAI_API_KEY
     if not os.environ.get("OPENAI_API_KEY"):
         raise RuntimeError("OPENAI_API_KEY environment variable is not set. "
                            "Please set it to your OpenAI API key.")
 
-    # Run the main function
-    asyncio.run(main())
+    # Status messages go through logging; streamed answers are written to
+    # stdout directly, so keep both on a line-buffered stdout
+    # (libraries such as httpx log every request at INFO, so only this
+    # script's own logger is lowered to INFO)
+    sys.stdout.reconfigure(line_buffering=True)
+    logging.basicConfig(level=logging.WARNING,
+                        handlers=[logging.StreamHandler(sys.stdout)],
+                        format="%(message)s")
+    log.setLevel(logging.INFO)
+
+    # Run the main function, on uvloop's libuv-based event loop where it's
+    # available (it doesn't support Windows)
+    if sys.platform != "win32":
+        import uvloop
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
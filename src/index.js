@@ -28,6 +28,9 @@ const __dirname = dirname(__filename);
 const OPENAI_API_KEY = process.env.OPENAI_API_KEY;
 const OPENAI_BASE_URL = process.env.OPENAI_BASE_URL;
 const OPENAI_MODEL = process.env.OPENAI_MODEL || "whisper-1";
+// Episodes of a batch transcribed at the same time; more mostly runs into
+// the transcription API's rate limits
+const MAX_CONCURRENT_EPISODES = 2;
 
 if (!OPENAI_API_KEY) {
   throw new Error('OPENAI_API_KEY environment variable is required');
@@ -65,13 +68,20 @@ const isValidTranscribeArgs = (args) =>
   typeof args === 'object' &&
   args !== null &&
   (
-    // Either filepath OR episode_url must be provided
+    // Either filepath, episode_url OR episode_urls must be provided
     (typeof args.filepath === 'string') ||
-    (typeof args.episode_url === 'string')
+    (typeof args.episode_url === 'string') ||
+    (Array.isArray(args.episode_urls) &&
+     args.episode_urls.length > 0 &&
+     args.episode_urls.every((url) => typeof url === 'string'))
   ) &&
   (args.save_to_file === undefined || 
    typeof args.save_to_file === 'boolean' || 
    typeof args.save_to_file === 'string') &&
+  (args.local_path === undefined || typeof args.local_path === 'string') &&
+  (args.local_paths === undefined ||
+   (Array.isArray(args.local_paths) &&
+    args.local_paths.every((localPath) => typeof localPath === 'string'))) &&
   (args.language === undefined || typeof args.language === 'string') &&
   (args.max_chunk_size === undefined || typeof args.max_chunk_size === 'number') &&
   (args.full_transcription === undefined || typeof args.full_transcription === 'boolean');
@@ -152,11 +162,25 @@ class PodcastTranscriberServer {
             properties: {
               filepath: {
                 type: 'string',
-                description: 'Absolute path to an existing audio file. Use this OR episode_url.',
+                description: 'Absolute path to an existing audio file. Use this OR episode_url OR episode_urls.',
               },
               episode_url: {
                 type: 'string',
-                description: 'URL of the podcast episode to download and transcribe. Use this OR filepath.',
+                description: 'URL of the podcast episode to download and transcribe. Use this OR filepath OR episode_urls.',
+              },
+              episode_urls: {
+                type: 'array',
+                items: { type: 'string' },
+                description: 'URLs of several podcast episodes to download and transcribe concurrently in one call. Use this OR filepath OR episode_url.',
+              },
+              local_path: {
+                type: 'string',
+                description: 'Path of an already downloaded copy of episode_url. If the file exists it is used instead of downloading the episode.',
+              },
+              local_paths: {
+                type: 'array',
+                items: { type: 'string' },
+                description: 'Already downloaded copies of episode_urls, in the same order ("" where there is none). Existing files are used instead of downloading.',
               },
               save_to_file: {
                 type: 'boolean',
@@ -334,9 +358,8 @@ class PodcastTranscriberServer {
   
   // Helper function to create a temporary directory for audio chunks
   async createTempDir() {
-    const tempDir = path.join(os.tmpdir(), `podcast-transcriber-${Date.now()}`);
-    await promisify(fs.mkdir)(tempDir, { recursive: true });
-    return tempDir;
+    // mkdtemp keeps concurrent transcriptions from sharing a directory
+    return await promisify(fs.mkdtemp)(path.join(os.tmpdir(), 'podcast-transcriber-'));
   }
   
   // Helper function to clean up temporary files
@@ -431,6 +454,37 @@ class PodcastTranscriberServer {
     }
   }
   
+  // Transcribe several episodes, MAX_CONCURRENT_EPISODES at a time, one
+  // text item per episode
+  async handleTranscribeBatch(args) {
+    const { episode_urls, local_paths = [], filepath, episode_url, local_path, ...options } = args;
+    console.error(`[DEBUG] Batch transcription of ${episode_urls.length} episodes`);
+    
+    const results = new Array(episode_urls.length);
+    let next = 0;
+    const worker = async () => {
+      while (next < episode_urls.length) {
+        const i = next++;
+        results[i] = await this.handleTranscribeAudio({
+          ...options,
+          episode_url: episode_urls[i],
+          local_path: local_paths[i] || undefined,
+        });
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(MAX_CONCURRENT_EPISODES, episode_urls.length) }, worker)
+    );
+    
+    return {
+      content: results.map((result, i) => ({
+        type: 'text',
+        text: `Episode URL: ${episode_urls[i]}\n${result.content[0].text}`,
+      })),
+      isError: results.every((result) => result.isError),
+    };
+  }
+  
   // Main transcription handler
   async handleTranscribeAudio(args) {
     if (!isValidTranscribeArgs(args)) {
@@ -440,6 +494,10 @@ class PodcastTranscriberServer {
       );
     }
     
+    if (Array.isArray(args.episode_urls)) {
+      return await this.handleTranscribeBatch(args);
+    }
+    
     let fileStream = null;
     let tempDir = null;
     let audioFilePath = null;
@@ -449,6 +507,7 @@ class PodcastTranscriberServer {
       const { 
         filepath, 
         episode_url,
+        local_path,
         save_to_file, 
         language = "en", 
         full_transcription = false,
@@ -463,6 +522,10 @@ class PodcastTranscriberServer {
         // Use the provided filepath
         audioFilePath = filepath;
         console.error(`[DEBUG] Using provided audio file: ${audioFilePath}`);
+      } else if (episode_url && local_path && fs.existsSync(local_path)) {
+        // The caller already downloaded the episode
+        audioFilePath = local_path;
+        console.error(`[DEBUG] Using local copy of ${episode_url}: ${audioFilePath}`);
       } else if (episode_url) {
         // Download the episode
         console.error(`[DEBUG] Transcription: downloading episode from URL: ${episode_url}`);